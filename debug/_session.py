@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# debug/_session.py
+"""
+Shared helpers for the debug scripts that run the math server as a subprocess.
+"""
+
+import asyncio
+import shutil
+import sys
+from contextlib import asynccontextmanager
+
+# StreamReader buffer limit; raised from the 64 KiB default so that a large
+# response (e.g. tools/list) still fits in a single readuntil() line.
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+def server_command():
+    """Prefer the installed CLI, falling back to running the module directly."""
+    if shutil.which("chuk-mcp-math-server"):
+        print("📍 Using installed command: chuk-mcp-math-server")
+        return ["chuk-mcp-math-server"]
+
+    print("📍 Using module: python -m chuk_mcp_math_server.cli")
+    return [sys.executable, "-m", "chuk_mcp_math_server.cli"]
+
+
+@asynccontextmanager
+async def mcp_server_session(*args, transport="stdio"):
+    """Run the server with piped stdio for the duration of the block."""
+    process = await asyncio.create_subprocess_exec(
+        *server_command(),
+        "--transport",
+        transport,
+        *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=STREAM_LIMIT,
+    )
+    try:
+        yield process
+    finally:
+        if process.returncode is None:
+            process.terminate()
+        await process.wait()
+
+
+async def read_message(stream):
+    """Read one newline-terminated message, or whatever arrived before EOF.
+
+    There is no per-read timeout; callers wrap a whole exchange in a single
+    ``asyncio.timeout`` instead.
+    """
+    try:
+        return await stream.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
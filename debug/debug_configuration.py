@@ -5,64 +5,49 @@ Test the configuration system with different setups.
 """
 
 import asyncio
-import subprocess
 import json
-import tempfile
 import os
-from pathlib import Path
+import signal
 
+from _session import server_command
 
-async def test_configuration_system():
-    """Test various configuration options."""
-    print("⚙️ Configuration System Test")
-    print("=" * 40)
+try:
+    from orjson import dumps, loads
+except ImportError:
 
-    # Use the installed CLI command
-    server_base_cmd = ["chuk-mcp-math-server"]
-    print("📍 Using installed command: chuk-mcp-math-server")
+    def dumps(obj):
+        return json.dumps(obj).encode()
 
-    # Test 1: Show current configuration
-    print("\n🔍 Test 1: Show Configuration")
-    try:
-        result = subprocess.run(
-            [*server_base_cmd, "--show-config"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+    loads = json.loads
 
-        if result.returncode == 0:
-            print("✅ Configuration display works")
-            config = json.loads(result.stdout.split("\n", 1)[1])
-            print(
-                f"📊 Default functions enabled: {config.get('enable_tools', 'unknown')}"
-            )
-        else:
-            print(f"❌ Config display failed: {result.stderr}")
-    except Exception as e:
-        print(f"❌ Config test failed: {e}")
 
-    # Test 2: Domain filtering
-    print("\n🔍 Test 2: Domain Filtering")
-    try:
-        result = subprocess.run(
-            [*server_base_cmd, "--domains", "arithmetic", "--show-config"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+async def _terminate_tree(process, grace=1.0):
+    """Stop a process and anything it spawned: SIGTERM, then SIGKILL after grace."""
+    if process.returncode is not None:
+        return
 
-        if result.returncode == 0:
-            print("✅ Domain filtering works")
-            config = json.loads(result.stdout.split("\n", 1)[1])
-            print(f"📊 Domain allowlist: {config.get('domain_allowlist', [])}")
-        else:
-            print(f"❌ Domain filtering failed: {result.stderr}")
-    except Exception as e:
-        print(f"❌ Domain test failed: {e}")
+    if os.name == "nt":
+        process.kill()
+    else:
+        # The server runs in its own session, so its pid is also the group id
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            await asyncio.wait_for(process.wait(), timeout=grace)
+            return
+        except TimeoutError:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
-    # Test 3: Configuration file
-    print("\n🔍 Test 3: Configuration File")
+    await process.wait()
+
+
+async def test_configuration_system():
+    """Test various configuration options."""
+    print("⚙️ Configuration System Test")
+    print("=" * 40)
+
+    server_base_cmd = server_command()
 
     config_content = """
 transport: "stdio"
@@ -79,59 +64,99 @@ cache_strategy: "none"
 computation_timeout: 5.0
 """
 
+    # (title, success message, checked key, expected value, scenario) - all
+    # scenarios are resolved by a single server invocation to avoid repeated
+    # start-up cost
+    tests = [
+        (
+            "Show Configuration",
+            "Configuration display works",
+            "enable_tools",
+            True,
+            {},
+        ),
+        (
+            "Domain Filtering",
+            "Domain filtering works",
+            "domain_allowlist",
+            ["arithmetic"],
+            {"args": ["--domains", "arithmetic"]},
+        ),
+        (
+            "Configuration File",
+            "Configuration file loading works",
+            "function_allowlist",
+            ["add", "subtract", "multiply"],
+            {"config": config_content},
+        ),
+        (
+            "Environment Variables",
+            "Environment variables work",
+            "cache_strategy",
+            "memory",
+            {
+                "env": {
+                    "MCP_MATH_ENABLE_PROMPTS": "false",
+                    "MCP_MATH_CACHE_STRATEGY": "memory",
+                    "MCP_MATH_DOMAIN_ALLOWLIST": "arithmetic,number_theory",
+                }
+            },
+        ),
+    ]
+
     try:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(config_content)
-            config_file = f.name
-
-        result = subprocess.run(
-            [*server_base_cmd, "--config", config_file, "--show-config"],
-            capture_output=True,
-            text=True,
-            timeout=10,
+        process = await asyncio.create_subprocess_exec(
+            *server_base_cmd,
+            "--show-config-batch",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-
-        os.unlink(config_file)
-
-        if result.returncode == 0:
-            print("✅ Configuration file loading works")
-            config = json.loads(result.stdout.split("\n", 1)[1])
-            print(f"📊 Function allowlist: {config.get('function_allowlist', [])}")
-        else:
-            print(f"❌ Config file test failed: {result.stderr}")
     except Exception as e:
-        print(f"❌ Config file test failed: {e}")
+        print(f"❌ Configuration tests failed: {e}")
+        return
 
-    # Test 4: Environment variables
-    print("\n🔍 Test 4: Environment Variables")
     try:
-        env = os.environ.copy()
-        env.update(
-            {
-                "MCP_MATH_ENABLE_PROMPTS": "false",
-                "MCP_MATH_CACHE_STRATEGY": "memory",
-                "MCP_MATH_DOMAIN_ALLOWLIST": "arithmetic,number_theory",
-            }
+        scenarios = dumps([scenario for *_, scenario in tests])
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(scenarios), timeout=10
         )
-
-        result = subprocess.run(
-            [*server_base_cmd, "--show-config"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            env=env,
+    except TimeoutError:
+        print("❌ Configuration tests failed: timed out after 10s")
+        return
+    finally:
+        await _terminate_tree(process)
+
+    if process.returncode != 0:
+        print(f"❌ Configuration tests failed: {stderr.decode()}")
+        return
+
+    configs = loads(stdout)
+    if len(configs) != len(tests):
+        print(
+            f"❌ Configuration tests failed: expected {len(tests)} results, "
+            f"got {len(configs)}"
         )
-
-        if result.returncode == 0:
-            print("✅ Environment variables work")
-            config = json.loads(result.stdout.split("\n", 1)[1])
-            print(f"📊 Cache strategy: {config.get('cache_strategy', 'unknown')}")
+        return
+
+    failures = 0
+    for i, ((title, message, key, expected, _), config) in enumerate(
+        zip(tests, configs), 1
+    ):
+        print(f"\n🔍 Test {i}: {title}")
+        actual = config.get(key, "unknown")
+        if actual == expected:
+            print(f"✅ {message}")
         else:
-            print(f"❌ Environment test failed: {result.stderr}")
-    except Exception as e:
-        print(f"❌ Environment test failed: {e}")
-
-    print("\n✅ Configuration tests completed!")
+            failures += 1
+            print(f"❌ {title} failed: expected {key}={expected!r}")
+        print(f"📊 {key}: {actual}")
+
+    if failures:
+        print(f"\n❌ {failures} of {len(tests)} configuration tests failed")
+    else:
+        print("\n✅ Configuration tests completed!")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,41 @@
 # debug/debug_math_functions.py
 """
 Enhanced debug script to check math function loading and demonstrate successful integration.
+
+Detailed listings are only printed with -v/--verbose or DEBUG=1 in the environment.
 """
 
+import os
 import sys
 import asyncio
+import types
+
+VERBOSE = bool(os.environ.get("DEBUG")) or bool({"-v", "--verbose"} & set(sys.argv[1:]))
+
+# Module helpers that are callable but not mathematical functions
+EXCLUDE = frozenset(
+    {"get_module_info", "get_reorganized_modules", "print_reorganized_status"}
+)
+
+
+def vprint(*args, **kwargs):
+    """Print only when verbose output was requested."""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+
+def public_functions(module, exclude=EXCLUDE):
+    """Return the names of the public functions exported by a module."""
+    names = []
+    for name, obj in sorted(vars(module).items()):
+        if name.startswith("_") or name in exclude or not callable(obj):
+            continue
+        try:
+            _ = obj.__name__
+        except AttributeError:
+            continue
+        names.append(name)
+    return names
 
 
 async def debug_math_functions():
@@ -21,48 +52,47 @@ async def debug_math_functions():
         # Check what functions are available in the module
         print("\n📋 Available in chuk_mcp_math:")
         module_attrs = []
-        for attr in dir(chuk_mcp_math):
+        for attr, obj in sorted(vars(chuk_mcp_math).items()):
             if not attr.startswith("_"):
-                obj = getattr(chuk_mcp_math, attr)
                 module_attrs.append((attr, type(obj)))
 
         # Group by type for better readability
-        functions = [item for item in module_attrs if "function" in str(item[1])]
-        modules = [item for item in module_attrs if "module" in str(item[1])]
-        classes = [
-            item
-            for item in module_attrs
-            if "class" in str(item[1]) or "type" in str(item[1])
-        ]
-        others = [
-            item for item in module_attrs if item not in functions + modules + classes
-        ]
+        functions, modules, classes = [], [], []
+        for item in module_attrs:
+            type_name = str(item[1])
+            if "function" in type_name:
+                functions.append(item)
+            elif "module" in type_name:
+                modules.append(item)
+            else:
+                classes.append(item)
 
         print(f"  📚 Functions ({len(functions)}):")
         for attr, obj_type in functions[:10]:  # Show first 10
-            print(f"    • {attr}: {obj_type}")
+            vprint(f"    • {attr}: {obj_type}")
         if len(functions) > 10:
-            print(f"    ... and {len(functions) - 10} more functions")
+            vprint(f"    ... and {len(functions) - 10} more functions")
 
         print(f"  📦 Modules ({len(modules)}):")
         for attr, obj_type in modules:
-            print(f"    • {attr}: {obj_type}")
+            vprint(f"    • {attr}: {obj_type}")
 
         print(f"  🏗️ Classes/Types ({len(classes)}):")
         for attr, obj_type in classes:
-            print(f"    • {attr}: {obj_type}")
+            vprint(f"    • {attr}: {obj_type}")
 
         # Try to get functions using the original method
         print("\n🔍 Testing get_mcp_functions()...")
+        mcp_functions = {}
         try:
             from chuk_mcp_math import get_mcp_functions
 
-            functions = get_mcp_functions()
-            print(f"📊 get_mcp_functions() returned {len(functions)} functions")
+            mcp_functions = get_mcp_functions()
+            print(f"📊 get_mcp_functions() returned {len(mcp_functions)} functions")
 
-            if len(functions) > 0:
+            if len(mcp_functions) > 0 and VERBOSE:
                 print("\n📋 Sample functions from get_mcp_functions():")
-                for i, (name, spec) in enumerate(list(functions.items())[:5]):
+                for i, (name, spec) in enumerate(list(mcp_functions.items())[:5]):
                     print(
                         f"  • {name}: {spec.function_name} ({spec.namespace}.{spec.category})"
                     )
@@ -70,7 +100,7 @@ async def debug_math_functions():
                 # Analyze the function distribution
                 domains = {}
                 categories = {}
-                for spec in functions.values():
+                for spec in mcp_functions.values():
                     domains[spec.namespace] = domains.get(spec.namespace, 0) + 1
                     categories[spec.category] = categories.get(spec.category, 0) + 1
 
@@ -82,7 +112,7 @@ async def debug_math_functions():
                 for category, count in sorted(categories.items()):
                     print(f"  • {category}: {count} functions")
 
-            else:
+            elif len(mcp_functions) == 0:
                 print(
                     "⚠️ get_mcp_functions() returned 0 functions - using direct module access"
                 )
@@ -94,34 +124,15 @@ async def debug_math_functions():
 
         # Test direct module access (our working solution)
         print("\n🔍 Testing direct module access...")
+        arithmetic_funcs, number_theory_funcs = [], []
         try:
             from chuk_mcp_math import arithmetic, number_theory
 
             print("✅ Successfully imported arithmetic and number_theory modules")
 
-            # Count arithmetic functions
-            arithmetic_funcs = []
-            for attr in dir(arithmetic):
-                if not attr.startswith("_") and callable(getattr(arithmetic, attr)):
-                    func = getattr(arithmetic, attr)
-                    if hasattr(func, "__name__") and attr not in [
-                        "get_module_info",
-                        "get_reorganized_modules",
-                        "print_reorganized_status",
-                    ]:
-                        arithmetic_funcs.append(attr)
-
-            # Count number theory functions
-            number_theory_funcs = []
-            for attr in dir(number_theory):
-                if not attr.startswith("_") and callable(getattr(number_theory, attr)):
-                    func = getattr(number_theory, attr)
-                    if hasattr(func, "__name__") and attr not in [
-                        "get_module_info",
-                        "get_reorganized_modules",
-                        "print_reorganized_status",
-                    ]:
-                        number_theory_funcs.append(attr)
+            # Count arithmetic and number theory functions
+            arithmetic_funcs = public_functions(arithmetic)
+            number_theory_funcs = public_functions(number_theory)
 
             print("📊 Direct module access results:")
             print(f"  • arithmetic: {len(arithmetic_funcs)} functions")
@@ -131,17 +142,17 @@ async def debug_math_functions():
             )
 
             # Show some examples from each module
-            print("\n📋 Sample arithmetic functions:")
+            vprint("\n📋 Sample arithmetic functions:")
             for func in arithmetic_funcs[:8]:
-                print(f"  • {func}")
+                vprint(f"  • {func}")
             if len(arithmetic_funcs) > 8:
-                print(f"  ... and {len(arithmetic_funcs) - 8} more")
+                vprint(f"  ... and {len(arithmetic_funcs) - 8} more")
 
-            print("\n📋 Sample number_theory functions:")
+            vprint("\n📋 Sample number_theory functions:")
             for func in number_theory_funcs[:8]:
-                print(f"  • {func}")
+                vprint(f"  • {func}")
             if len(number_theory_funcs) > 8:
-                print(f"  ... and {len(number_theory_funcs) - 8} more")
+                vprint(f"  ... and {len(number_theory_funcs) - 8} more")
 
         except ImportError as e:
             print(f"❌ Failed to import arithmetic/number_theory: {e}")
@@ -151,32 +162,23 @@ async def debug_math_functions():
         try:
             from chuk_mcp_math import arithmetic, number_theory
 
-            # Test arithmetic functions
-            test_results = []
-
-            # Basic arithmetic
-            result = await arithmetic.add(15, 27)
-            test_results.append(f"add(15, 27) = {result}")
-
-            result = await arithmetic.multiply(6, 7)
-            test_results.append(f"multiply(6, 7) = {result}")
-
-            result = await arithmetic.sqrt(144)
-            test_results.append(f"sqrt(144) = {result}")
-
-            # Number theory
-            result = await number_theory.is_prime(97)
-            test_results.append(f"is_prime(97) = {result}")
-
-            result = await number_theory.gcd(48, 18)
-            test_results.append(f"gcd(48, 18) = {result}")
-
-            result = await number_theory.fibonacci(10)
-            test_results.append(f"fibonacci(10) = {result}")
+            # The calls are independent, so run them concurrently
+            calls = {
+                "add(15, 27)": arithmetic.add(15, 27),
+                "multiply(6, 7)": arithmetic.multiply(6, 7),
+                "sqrt(144)": arithmetic.sqrt(144),
+                "is_prime(97)": number_theory.is_prime(97),
+                "gcd(48, 18)": number_theory.gcd(48, 18),
+                "fibonacci(10)": number_theory.fibonacci(10),
+            }
+            results = await asyncio.gather(*calls.values())
+            test_results = [
+                f"{call} = {result}" for call, result in zip(calls, results)
+            ]
 
             print("✅ All async function tests passed:")
             for test_result in test_results:
-                print(f"  • {test_result}")
+                vprint(f"  • {test_result}")
 
         except Exception as e:
             print(f"❌ Async function test failed: {e}")
@@ -197,18 +199,11 @@ async def debug_math_functions():
             for module_name in potential_modules:
                 try:
                     module = getattr(chuk_mcp_math, module_name)
-                    if hasattr(module, "__file__") or hasattr(module, "__path__"):
+                    if isinstance(module, types.ModuleType):
                         found_modules.append(module_name)
 
                         # Count functions in this module
-                        funcs = []
-                        for attr in dir(module):
-                            if not attr.startswith("_") and callable(
-                                getattr(module, attr)
-                            ):
-                                func = getattr(module, attr)
-                                if hasattr(func, "__name__"):
-                                    funcs.append(attr)
+                        funcs = public_functions(module, exclude=frozenset())
                         print(f"  • {module_name}: {len(funcs)} functions")
 
                 except AttributeError:
@@ -228,9 +223,7 @@ async def debug_math_functions():
         print(
             f"  • Library version: {getattr(chuk_mcp_math, '__version__', 'unknown')}"
         )
-        print(
-            f"  • get_mcp_functions(): {len(functions) if 'functions' in locals() else 0} functions"
-        )
+        print(f"  • get_mcp_functions(): {len(mcp_functions)} functions")
         print(f"  • Direct module access: {total_direct_functions} functions")
         print("  • Async execution: ✅ Working")
         print("  • MCP Server integration: ✅ Successful")
@@ -5,7 +5,18 @@ Enhanced debug script to check what methods are available on the MCPServer objec
 and analyze the complete chuk-mcp library structure.
 """
 
+import functools
 import inspect
+import types
+
+
+@functools.cache
+def _safe_signature(func):
+    """Return the signature of a callable, or None if it can't be inspected."""
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
 
 
 def analyze_mcp_server():
@@ -34,11 +45,8 @@ def analyze_mcp_server():
 
         print("📋 Available Methods:")
         for method in sorted(methods):
-            try:
-                sig = inspect.signature(getattr(server, method))
-                print(f"  • {method}{sig}")
-            except:
-                print(f"  • {method}()")
+            sig = _safe_signature(getattr(server, method))
+            print(f"  • {method}{sig if sig is not None else '()'}")
 
         print("\n📋 Available Attributes:")
         for attr in sorted(attributes):
@@ -60,11 +68,9 @@ def analyze_mcp_server():
         for method in required_methods:
             if hasattr(server, method):
                 print(f"  ✅ {method} - Available")
-                try:
-                    sig = inspect.signature(getattr(server, method))
+                sig = _safe_signature(getattr(server, method))
+                if sig is not None:
                     print(f"    Signature: {method}{sig}")
-                except:
-                    pass
             else:
                 print(f"  ❌ {method} - Missing")
 
@@ -105,11 +111,9 @@ def analyze_mcp_server():
                 handle_msg = getattr(handler, "handle_message")
                 is_async = inspect.iscoroutinefunction(handle_msg)
                 print(f"  • handle_message is async: {is_async}")
-                try:
-                    sig = inspect.signature(handle_msg)
+                sig = _safe_signature(handle_msg)
+                if sig is not None:
                     print(f"  • handle_message signature: {sig}")
-                except:
-                    pass
 
         return True
 
@@ -136,9 +140,8 @@ def analyze_chuk_mcp_structure():
 
         # Get top-level items
         top_level = {}
-        for attr in dir(chuk_mcp):
+        for attr, obj in vars(chuk_mcp).items():
             if not attr.startswith("_"):
-                obj = getattr(chuk_mcp, attr)
                 obj_type = type(obj).__name__
                 if obj_type not in top_level:
                     top_level[obj_type] = []
@@ -154,12 +157,11 @@ def analyze_chuk_mcp_structure():
         # Check for transport-related items
         print("\n🚛 Transport-related items:")
         transport_items = []
-        for attr in dir(chuk_mcp):
+        for attr, obj in sorted(vars(chuk_mcp).items()):
             if any(
                 keyword in attr.lower()
                 for keyword in ["transport", "stdio", "http", "client", "server"]
             ):
-                obj = getattr(chuk_mcp, attr)
                 transport_items.append((attr, type(obj)))
 
         if transport_items:
@@ -175,15 +177,15 @@ def analyze_chuk_mcp_structure():
         for submodule in potential_submodules:
             if hasattr(chuk_mcp, submodule):
                 sub = getattr(chuk_mcp, submodule)
-                if hasattr(sub, "__file__") or hasattr(sub, "__path__"):
+                if isinstance(sub, types.ModuleType):
                     print(f"  ✅ {submodule}: {type(sub)}")
 
                     # List contents of server module specifically
                     if submodule == "server":
                         print("    📋 server module contents:")
-                        for item in dir(sub):
+                        for item, value in sorted(vars(sub).items()):
                             if not item.startswith("_"):
-                                print(f"      • {item}: {type(getattr(sub, item))}")
+                                print(f"      • {item}: {type(value)}")
                 else:
                     print(f"  ⚠️ {submodule}: {type(sub)} (not a module)")
             else:
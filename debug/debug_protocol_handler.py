@@ -5,7 +5,54 @@ Debug script to check what methods are available on the protocol_handler.
 """
 
 import sys
+import functools
 import inspect
+import types
+
+# Substrings that mark a method as a possible entry point
+RUN_KEYWORDS = ("run", "start", "serve", "handle", "process", "execute")
+
+
+@functools.cache
+def _function_signature(func):
+    """Signature of a plain function, preferring an explicit __signature__."""
+    sig = getattr(func, "__signature__", None)
+    return sig if isinstance(sig, inspect.Signature) else inspect.signature(func)
+
+
+def _fast_signature_str(obj):
+    """Signature text built from __code__, for functions taking only plain
+    positional-or-keyword arguments; returns None when inspect is needed."""
+    func = getattr(obj, "__func__", obj)
+    code = getattr(func, "__code__", None)
+    if (
+        code is None
+        or code.co_posonlyargcount
+        or code.co_kwonlyargcount
+        or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        or getattr(func, "__defaults__", None)
+        or getattr(func, "__annotations__", None)
+        or hasattr(func, "__wrapped__")
+        or hasattr(func, "__signature__")
+    ):
+        return None
+    names = code.co_varnames[: code.co_argcount]
+    if func is not obj:
+        names = names[1:]
+    return f"({', '.join(names)})"
+
+
+def _signature(obj):
+    """Signature of a callable; plain functions are cached, other callables
+    (bound methods, unhashable objects) are inspected directly."""
+    if inspect.ismethod(obj):
+        return inspect.signature(obj)
+    try:
+        return _function_signature(obj)
+    except TypeError:
+        # Unhashable callables can't be cache keys
+        return _function_signature.__wrapped__(obj)
+
 
 try:
     from chuk_mcp.server import MCPServer
@@ -20,24 +67,35 @@ try:
 
     print(f"📋 Protocol handler type: {type(handler)}")
 
-    # Get all methods and attributes
-    methods = []
-    attributes = []
-
-    for name in dir(handler):
-        if not name.startswith("_"):
-            obj = getattr(handler, name)
-            if callable(obj):
-                methods.append(name)
-            else:
-                attributes.append(name)
+    # Collect public names from the instance and each class along the MRO;
+    # object contributes nothing public, so it is skipped
+    namespaces = [getattr(handler, "__dict__", {})]
+    namespaces += [vars(cls) for cls in type(handler).__mro__ if cls is not object]
+    names = sorted(
+        {name for ns in namespaces for name in ns if not name.startswith("_")}
+    )
+
+    # Classify methods and attributes in a single pass
+    methods = {}
+    attributes = set()
+    run_like = []
+
+    for name in names:
+        obj = getattr(handler, name)
+        if callable(obj):
+            methods[name] = obj
+            lname = name.lower()
+            if any(keyword in lname for keyword in RUN_KEYWORDS):
+                run_like.append(name)
+        else:
+            attributes.add(name)
 
     print("📋 Available Methods:")
-    for method in sorted(methods):
+    for method, obj in methods.items():
         try:
-            sig = inspect.signature(getattr(handler, method))
+            sig = _fast_signature_str(obj) or _signature(obj)
             print(f"  • {method}{sig}")
-        except:
+        except (TypeError, ValueError):
             print(f"  • {method}()")
 
     print("\n📋 Available Attributes:")
@@ -56,7 +114,7 @@ try:
 
     print("\n🔍 Checking for required methods:")
     for method in required_methods:
-        if hasattr(handler, method):
+        if method in methods or method in attributes:
             print(f"  ✅ {method} - Available")
         else:
             print(f"  ❌ {method} - Missing")
@@ -68,12 +126,8 @@ try:
 
     # Check if there are any run-like methods
     print("\n🏃 Run-like methods:")
-    for method in methods:
-        if any(
-            keyword in method.lower()
-            for keyword in ["run", "start", "serve", "handle", "process", "execute"]
-        ):
-            print(f"  • {method}")
+    for method in run_like:
+        print(f"  • {method}")
 
     # Check what's available in the chuk_mcp module
     print("\n📦 Checking chuk_mcp module structure:")
@@ -83,10 +137,9 @@ try:
         print(f"  • chuk_mcp version: {getattr(chuk_mcp, '__version__', 'unknown')}")
 
         # Check submodules
-        for attr in dir(chuk_mcp):
+        for attr, obj in sorted(vars(chuk_mcp).items()):
             if not attr.startswith("_"):
-                obj = getattr(chuk_mcp, attr)
-                if hasattr(obj, "__file__") or hasattr(obj, "__path__"):
+                if isinstance(obj, types.ModuleType):
                     print(f"  • {attr} (module)")
                 else:
                     print(f"  • {attr}: {type(obj)}")
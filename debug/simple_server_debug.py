@@ -9,64 +9,83 @@ import sys
 import json
 from pathlib import Path
 
+from _session import mcp_server_session, read_message
+
+# orjson works on bytes directly, skipping the str encode/decode per message
+try:
+    import orjson
+
+    def encode_message(msg):
+        return orjson.dumps(msg) + b"\n"
+
+    decode_message = orjson.loads
+except ImportError:
+
+    def encode_message(msg):
+        return (json.dumps(msg) + "\n").encode()
+
+    decode_message = json.loads
+
+# Test initialize and a simple calculation (skip tools/list as it's too large).
+# The requests never change, so they are serialized once at import.
+INIT_MSG = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "clientInfo": {"name": "test-client"},
+    },
+}
+CALC_MSG = {
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/call",
+    "params": {"name": "add", "arguments": {"a": 5, "b": 3}},
+}
+REQUESTS = b"".join(map(encode_message, (INIT_MSG, CALC_MSG)))
+
 
 async def simple_server_test():
     """Run a simple test of the math server."""
     print("🧪 Simple Math Server Test")
     print("=" * 30)
 
-    # Use the installed CLI command
-    server_cmd = ["chuk-mcp-math-server", "--transport", "stdio"]
-    print("📍 Using installed command: chuk-mcp-math-server")
-
     try:
         # Start server
         print("🚀 Starting server...")
-        process = await asyncio.create_subprocess_exec(
-            *server_cmd,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        # Wait for startup
-        await asyncio.sleep(2)
-
-        # Check if running
-        if process.returncode is not None:
-            stderr = await process.stderr.read()
-            print(f"❌ Server failed to start: {stderr.decode()}")
-            return False
+        async with mcp_server_session() as process:
+            # Both requests are pipelined in a single write and the responses
+            # matched up by id; the initialize response doubles as the
+            # readiness probe since it only arrives once the server is up.
+            process.stdin.write(REQUESTS)
+            await process.stdin.drain()
+
+            # Read responses - one newline-terminated JSON-RPC message each,
+            # all under a single 10s deadline
+            responses = {}
+            try:
+                async with asyncio.timeout(10.0):
+                    while len(responses) < 2:
+                        response_data = await read_message(process.stdout)
+                        if not response_data:
+                            break
+                        response = decode_message(response_data)
+                        if "id" in response:
+                            responses[response["id"]] = response
+            except TimeoutError:
+                pass
+
+            if 1 not in responses:
+                if process.returncode is None:
+                    process.terminate()
+                stderr = await process.stderr.read()
+                print(f"❌ Server failed to start: {stderr.decode()}")
+                return False
 
         print("✅ Server started successfully")
 
-        # Test initialize
-        init_msg = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2025-03-26",
-                "clientInfo": {"name": "test-client"},
-            },
-        }
-
-        # Send message
-        msg_json = json.dumps(init_msg) + "\n"
-        process.stdin.write(msg_json.encode())
-        await process.stdin.drain()
-
-        # Read response - use read until newline for large responses
-        response_data = b""
-        while True:
-            chunk = await asyncio.wait_for(process.stdout.read(1024), timeout=10.0)
-            if not chunk:
-                break
-            response_data += chunk
-            if b"\n" in response_data:
-                break
-
-        response = json.loads(response_data.decode().strip())
+        response = responses[1]
 
         if response.get("error") is not None:
             print(f"❌ Initialize failed: {response['error']}")
@@ -74,29 +93,7 @@ async def simple_server_test():
 
         print("✅ Initialize successful")
 
-        # Test a simple calculation (skip tools/list as it's too large)
-        calc_msg = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {"name": "add", "arguments": {"a": 5, "b": 3}},
-        }
-
-        msg_json = json.dumps(calc_msg) + "\n"
-        process.stdin.write(msg_json.encode())
-        await process.stdin.drain()
-
-        # Read response
-        response_data = b""
-        while True:
-            chunk = await asyncio.wait_for(process.stdout.read(1024), timeout=10.0)
-            if not chunk:
-                break
-            response_data += chunk
-            if b"\n" in response_data:
-                break
-
-        response = json.loads(response_data.decode().strip())
+        response = responses.get(2, {"error": "no response"})
 
         if response.get("error") is not None:
             print(f"❌ Calculation failed: {response['error']}")
@@ -105,18 +102,11 @@ async def simple_server_test():
         print("✅ Mathematical calculation successful")
         print(f"📊 add(5, 3) = {response['result']}")
 
-        # Clean shutdown
-        process.terminate()
-        await process.wait()
-
         print("✅ All tests passed!")
         return True
 
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        if "process" in locals():
-            process.terminate()
-            await process.wait()
         return False
 
 
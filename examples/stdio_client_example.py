@@ -36,15 +36,9 @@ class MCPMathClient:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            # Wait a moment for server to start
-            await asyncio.sleep(1.0)
-
-            # Check if process started successfully
-            if self.process.returncode is not None:
-                stderr_data = await self.process.stderr.read()
-                error_msg = stderr_data.decode() if stderr_data else "Unknown error"
-                raise RuntimeError(f"Server failed to start: {error_msg}")
-
+            # No startup delay or exit check: initialize() waits for the first
+            # response, and a server that fails to start shows up there as
+            # EOF or a timeout.
             print("🚀 Started MCP Math Server")
 
         except FileNotFoundError:
@@ -95,18 +89,21 @@ class MCPMathClient:
 
         # Read response with timeout - handle large responses
         try:
-            response_data = b""
-            while True:
-                chunk = await asyncio.wait_for(
-                    self.process.stdout.read(4096), timeout=10.0
-                )
-                if not chunk:
-                    break
-                response_data += chunk
-                if b"\n" in response_data:
-                    # Extract first complete line
-                    response_data = response_data.split(b"\n", 1)[0]
-                    break
+            # bytearray grows in place, and only the new chunk is searched
+            # for the end of the line
+            response_data = bytearray()
+            # One deadline for the whole response rather than one per chunk
+            async with asyncio.timeout(10.0):
+                while True:
+                    chunk = await self.process.stdout.read(4096)
+                    if not chunk:
+                        break
+                    newline = chunk.find(b"\n")
+                    if newline != -1:
+                        # Keep only the first complete line
+                        response_data += chunk[:newline]
+                        break
+                    response_data += chunk
         except asyncio.TimeoutError:
             raise RuntimeError("Server response timeout")
 
@@ -122,7 +119,7 @@ class MCPMathClient:
                 raise RuntimeError("No response from server")
 
         try:
-            response = json.loads(response_data.decode().strip())
+            response = json.loads(response_data)
             return response
         except json.JSONDecodeError as e:
             print(f"Raw response: {response_data.decode()[:200]}...")
@@ -11,12 +11,28 @@ __version__ = "0.2.0"
 __author__ = "Chuk AI Team"
 __description__ = "Configurable mathematical computation server for MCP protocol"
 
-# Main exports
-from .cli import main
-from .config import ServerConfig, load_configuration_from_sources
-from .function_filter import FunctionFilter
-from .math_config import MathServerConfig, load_math_configuration_from_sources
-from .math_server import ConfigurableMCPMathServer, create_math_server
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import main
+    from .config import ServerConfig, load_configuration_from_sources
+    from .function_filter import FunctionFilter
+    from .math_config import MathServerConfig, load_math_configuration_from_sources
+    from .math_server import ConfigurableMCPMathServer, create_math_server
+
+# Main exports, imported on first access (PEP 562) so that reading metadata
+# such as __version__ doesn't pull in the math library and MCP framework
+_LAZY = {
+    "main": "cli",
+    "ServerConfig": "config",
+    "load_configuration_from_sources": "config",
+    "FunctionFilter": "function_filter",
+    "MathServerConfig": "math_config",
+    "load_math_configuration_from_sources": "math_config",
+    "ConfigurableMCPMathServer": "math_server",
+    "create_math_server": "math_server",
+}
 
 __all__ = [
     # Core classes
@@ -37,14 +53,33 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
 # Convenience functions for quick server startup
 def run_server_stdio(**kwargs):
     """Quick stdio server startup."""
+    from . import create_math_server
+
     server = create_math_server(transport="stdio", **kwargs)
     server.run()
 
 
 def run_server_http(port=8000, host="0.0.0.0", **kwargs):  # nosec B104
     """Quick HTTP server startup."""
+    from . import create_math_server
+
     server = create_math_server(transport="http", port=port, host=host, **kwargs)
     server.run()
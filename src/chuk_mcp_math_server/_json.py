@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+# src/chuk_mcp_math_server/_json.py
+"""
+JSON serialization helpers that use orjson when it is available.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Reused by the stdlib fallback rather than configuring an encoder per call
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+
+def dumps_pretty(obj: Any) -> str:
+    """Serialize an object to indented JSON text."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return _PRETTY_ENCODER.encode(obj)
@@ -5,10 +5,14 @@ Command line interface for the MCP Math Server.
 """
 
 import argparse
+import functools
+import importlib.util
 import json
 import logging
+import os
 import sys
-from typing import Dict, Any
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 
 # Early logging configuration for stdio mode
 # This must happen BEFORE any other imports to catch import-time logs
@@ -28,8 +32,9 @@ elif "--transport" in sys.argv:
     except (ValueError, IndexError):
         pass
 
+from ._json import dumps_pretty
+from .config import parse_config_text
 from .math_config import MathServerConfig, load_math_configuration_from_sources
-from .math_server import ConfigurableMCPMathServer
 
 logger = logging.getLogger(__name__)
 
@@ -115,7 +120,6 @@ def create_argument_parser() -> argparse.ArgumentParser:
     perf_group.add_argument(
         "--cache-strategy",
         choices=["none", "memory", "smart"],
-        default="smart",
         help="Caching strategy (default: smart)",
     )
     perf_group.add_argument(
@@ -145,12 +149,23 @@ def create_argument_parser() -> argparse.ArgumentParser:
     config_group.add_argument(
         "--config", "-c", help="Load configuration from file (YAML or JSON)"
     )
+    config_group.add_argument(
+        "--config-stdin",
+        action="store_true",
+        help="Read YAML configuration from stdin instead of a file",
+    )
     config_group.add_argument(
         "--save-config", help="Save current configuration to file and exit"
     )
     config_group.add_argument(
         "--show-config", action="store_true", help="Show current configuration and exit"
     )
+    config_group.add_argument(
+        "--show-config-batch",
+        action="store_true",
+        help="Read a JSON list of configuration scenarios from stdin, "
+        "show each resolved configuration and exit",
+    )
 
     return parser
 
@@ -199,15 +214,88 @@ def args_to_config_overrides(args) -> Dict[str, Any]:
     return {k: v for k, v in cli_overrides.items() if v is not None}
 
 
+@contextmanager
+def _environ_overrides(overrides: Dict[str, str]) -> Iterator[None]:
+    """Temporarily apply environment variable overrides."""
+    previous = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def resolve_configuration(args, config_data: Optional[dict] = None) -> MathServerConfig:
+    """Resolve the effective configuration for parsed command line arguments."""
+    cli_overrides = args_to_config_overrides(args)
+    config = load_math_configuration_from_sources(
+        config_file=args.config, cli_overrides=cli_overrides, config_data=config_data
+    )
+
+    # For stdio mode, default to WARNING level unless explicitly set
+    if config.transport == "stdio" and not args.verbose and not args.quiet:
+        config.log_level = "WARNING"
+
+    return config
+
+
+def resolve_config_scenarios(
+    parser: argparse.ArgumentParser, scenarios: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Resolve several configuration scenarios in a single process.
+
+    Each scenario may contain ``args`` (command line arguments), ``config``
+    (YAML configuration text) and ``env`` (environment variable overrides).
+    """
+    results = []
+    for scenario in scenarios:
+        args = parser.parse_args(scenario.get("args", []))
+        config_text = scenario.get("config")
+        config_data = parse_config_text(config_text) if config_text else None
+
+        with _environ_overrides(scenario.get("env", {})):
+            config = resolve_configuration(args, config_data=config_data)
+        results.append(config.model_dump())
+
+    return results
+
+
+# Runtime dependencies that are only imported once the server starts,
+# mapped to the distribution that provides them
+REQUIRED_MODULES = {
+    "chuk_mcp_math": "chuk-mcp-math",
+    "chuk_mcp_server": "chuk-mcp-server",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
-    """Check and report on required dependencies."""
-    # All dependencies are required and checked at import time
-    # If we get here, they're all available
+    """Check and report on required dependencies (once per process)."""
+    # find_spec locates the modules without executing them
+    missing = [
+        package
+        for module, package in REQUIRED_MODULES.items()
+        if importlib.util.find_spec(module) is None
+    ]
+    if missing:
+        print(
+            f"❌ Missing required dependencies: {', '.join(missing)}",
+            file=sys.stderr,
+        )
+        return False
     return True
 
 
 def run_server(config: MathServerConfig):
     """Run the server with the given configuration."""
+    # Imported here so configuration-only commands (--show-config,
+    # --save-config) don't pay for loading the MCP framework
+    from .math_server import ConfigurableMCPMathServer
+
     try:
         # Create and run server
         server = ConfigurableMCPMathServer(config)
@@ -249,18 +337,32 @@ def main():
         logging.getLogger("chuk_mcp_math_server").setLevel(logging.WARNING)
 
     # Check dependencies first
-    check_dependencies()
+    if not check_dependencies():
+        sys.exit(1)
 
     try:
-        # Load configuration
-        cli_overrides = args_to_config_overrides(args)
-        config = load_math_configuration_from_sources(
-            config_file=args.config, cli_overrides=cli_overrides
-        )
+        if args.show_config_batch:
+            scenarios = json.load(sys.stdin)
+            print(dumps_pretty(resolve_config_scenarios(parser, scenarios)))
+            return
 
-        # For stdio mode, default to WARNING level unless explicitly set
-        if config.transport == "stdio" and not args.verbose and not args.quiet:
-            config.log_level = "WARNING"
+        # Load configuration; stdin and a file are alternative sources
+        if args.config_stdin and args.config:
+            parser.error("--config-stdin cannot be combined with --config")
+        config_data = parse_config_text(sys.stdin.read()) if args.config_stdin else None
+        config = resolve_configuration(args, config_data=config_data)
+
+        # stdin has been read to EOF, so it can't also carry the stdio
+        # JSON-RPC channel
+        if (
+            args.config_stdin
+            and config.transport == "stdio"
+            and not (args.show_config or args.save_config)
+        ):
+            parser.error(
+                "--config-stdin cannot be used to run the stdio transport; "
+                "combine it with --show-config, --save-config or --transport http"
+            )
 
         # Handle special options
         if args.save_config:
@@ -274,7 +376,7 @@ def main():
 
         if args.show_config:
             print("📊 Current Configuration:")
-            print(json.dumps(config.model_dump(), indent=2))
+            print(dumps_pretty(config.model_dump()))
             return
 
         # Run the server
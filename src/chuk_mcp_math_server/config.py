@@ -4,17 +4,55 @@
 Server configuration management using Pydantic.
 """
 
+import functools
 import json
 import logging
 import os
+from collections.abc import Callable
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 logger = logging.getLogger(__name__)
 
+# Generic environment variables as (env var, config field, converter)
+_SERVER_ENV_FIELDS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("MCP_SERVER_TRANSPORT", "transport", str),
+    ("MCP_SERVER_PORT", "port", int),
+    ("MCP_SERVER_HOST", "host", str),
+    ("MCP_SERVER_LOG_LEVEL", "log_level", str),
+    ("MCP_SERVER_CACHE_STRATEGY", "cache_strategy", str),
+    ("MCP_SERVER_CACHE_SIZE", "cache_size", int),
+    ("MCP_SERVER_NAME", "server_name", str),
+)
+
+
+@functools.cache
+def _yaml_support() -> tuple[Any, Any, Any]:
+    """Import PyYAML on first use, returning (yaml, SafeLoader, SafeDumper).
+
+    Env- and JSON-only startups never pay for the import. The libyaml C
+    loader/dumper are preferred when PyYAML was built with them.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+    return yaml, SafeLoader, SafeDumper
+
+
+def parse_config_text(content: str, file_format: str = "yaml") -> Any:
+    """Parse YAML or JSON configuration text."""
+    if file_format == "yaml":
+        yaml, loader, _ = _yaml_support()
+        return yaml.load(content, Loader=loader)
+    return json.loads(content)
+
 
 class ServerConfig(BaseModel):
     """Comprehensive server configuration with all customization options."""
@@ -62,6 +100,26 @@ class ServerConfig(BaseModel):
         "arbitrary_types_allowed": True,
     }
 
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_legacy_filter_keys(cls, data: Any) -> Any:
+        """Accept the older *_whitelist / *_blacklist filter keys."""
+        if not isinstance(data, dict):
+            return data
+
+        migrated = dict(data)
+        for key in data:
+            if key.endswith("_whitelist"):
+                new_key = key[: -len("_whitelist")] + "_allowlist"
+            elif key.endswith("_blacklist"):
+                new_key = key[: -len("_blacklist")] + "_denylist"
+            else:
+                continue
+            value = migrated.pop(key)
+            # The current key name wins if both are present
+            migrated.setdefault(new_key, value)
+        return migrated
+
     @classmethod
     def from_file(cls, config_path: str | Path) -> "ServerConfig":
         """Load configuration from file (YAML or JSON)."""
@@ -70,38 +128,25 @@ class ServerConfig(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {path}")
 
-        with open(path, "r") as f:
-            if path.suffix.lower() in [".yml", ".yaml"]:
-                data = yaml.safe_load(f)
-            elif path.suffix.lower() == ".json":
-                data = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config file format: {path.suffix}")
+        if path.suffix.lower() in [".yml", ".yaml"]:
+            file_format = "yaml"
+        elif path.suffix.lower() == ".json":
+            file_format = "json"
+        else:
+            raise ValueError(f"Unsupported config file format: {path.suffix}")
+
+        data = parse_config_text(path.read_text(), file_format)
 
         return cls(**data)
 
     @classmethod
     def from_env(cls) -> "ServerConfig":
         """Load configuration from environment variables."""
-        env_mapping = {
-            "MCP_SERVER_TRANSPORT": "transport",
-            "MCP_SERVER_PORT": ("port", int),
-            "MCP_SERVER_HOST": "host",
-            "MCP_SERVER_LOG_LEVEL": "log_level",
-            "MCP_SERVER_CACHE_STRATEGY": "cache_strategy",
-            "MCP_SERVER_CACHE_SIZE": ("cache_size", int),
-            "MCP_SERVER_NAME": "server_name",
-        }
-
         config_dict = {}
-        for env_var, field_info in env_mapping.items():
+        for env_var, field_name, converter in _SERVER_ENV_FIELDS:
             value = os.getenv(env_var)
             if value is not None:
-                if isinstance(field_info, tuple):
-                    field_name, converter = field_info
-                    config_dict[field_name] = converter(value)
-                else:
-                    config_dict[field_info] = value
+                config_dict[field_name] = converter(value)
 
         return cls(**config_dict)
 
@@ -111,8 +156,13 @@ class ServerConfig(BaseModel):
 
         with open(path, "w") as f:
             if path.suffix.lower() in [".yml", ".yaml"]:
+                yaml, _, dumper = _yaml_support()
                 yaml.dump(
-                    self.model_dump(), f, default_flow_style=False, sort_keys=False
+                    self.model_dump(),
+                    f,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
                 )
             elif path.suffix.lower() == ".json":
                 json.dump(self.model_dump(), f, indent=2)
@@ -140,11 +190,17 @@ def load_configuration_from_sources(
     else:
         base_dict = {}
 
-    # Apply environment overrides
+    # Apply environment overrides, only for fields whose env var is set; the
+    # env config is only built when there is at least one
     if env_overrides:
-        env_config = ServerConfig.from_env()
-        env_dict = {k: v for k, v in env_config.model_dump().items() if k in os.environ}
-        base_dict.update(env_dict)
+        env_fields = [
+            field_name
+            for env_var, field_name, _ in _SERVER_ENV_FIELDS
+            if env_var in os.environ
+        ]
+        if env_fields:
+            env_dict = ServerConfig.from_env().model_dump()
+            base_dict.update({field: env_dict[field] for field in env_fields})
 
     # Apply CLI overrides (highest priority)
     if cli_overrides:
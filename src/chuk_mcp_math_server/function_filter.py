@@ -4,8 +4,13 @@
 Function filtering system for controlling which mathematical functions are exposed.
 """
 
+import functools
+import heapq
 import inspect
 import logging
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
 from typing import Any, Optional, Protocol
 
 from .config import ServerConfig
@@ -64,107 +69,240 @@ class MockFunctionSpec:
             self.parameters = {}
 
 
+@functools.cache
+def _load_from_math_library() -> dict[str, FunctionSpec]:
+    """Load functions using the standard chuk_mcp_math interface.
+
+    The registry is loaded once per process and shared by every FunctionFilter;
+    FunctionFilter.reset_cache() clears it to force a reload.
+    """
+    # Import modules to register their functions
+    # This is required because chuk_mcp_math doesn't auto-import to avoid circular imports
+    from chuk_mcp_math import get_mcp_functions
+    from chuk_mcp_math import number_theory  # noqa: F401
+    from chuk_mcp_math.arithmetic import comparison, core  # noqa: F401
+
+    try:
+        # Import trigonometry functions if available
+        from chuk_mcp_math import trigonometry  # noqa: F401
+
+        logger.debug("Imported trigonometry module")
+    except ImportError:
+        logger.debug("Trigonometry module not available")
+
+    # Get the registered functions
+    functions = get_mcp_functions()
+    logger.info(f"Loaded {len(functions)} functions from chuk_mcp_math")
+    return functions  # type: ignore[no-any-return]
+
+
+# Config fields that select which functions are exposed
+_FILTER_FIELDS = (
+    "function_allowlist",
+    "function_denylist",
+    "domain_allowlist",
+    "domain_denylist",
+    "category_allowlist",
+    "category_denylist",
+)
+
+# Read-only filtered views shared by every FunctionFilter, keyed by the filter
+# settings and evicted least recently used first. Each entry keeps the registry
+# it was built from so a reload invalidates it.
+_FILTERED_CACHE_SIZE = 64
+_filtered_cache: OrderedDict[
+    tuple[frozenset[str], ...],
+    tuple[dict[str, FunctionSpec], Mapping[str, FunctionSpec]],
+] = OrderedDict()
+
+
+# Registry entries grouped by namespace, as (position, qualified_name, spec)
+# so the groups can be merged back in registry order; keyed by registry id
+_namespace_buckets: dict[
+    int,
+    tuple[dict[str, FunctionSpec], dict[str, list[tuple[int, str, FunctionSpec]]]],
+] = {}
+
+
+def _buckets_by_namespace(
+    all_functions: dict[str, FunctionSpec],
+) -> dict[str, list[tuple[int, str, FunctionSpec]]]:
+    """Group a registry by namespace, building the index once per registry."""
+    cached = _namespace_buckets.get(id(all_functions))
+    if cached is not None and cached[0] is all_functions:
+        return cached[1]
+
+    buckets: dict[str, list[tuple[int, str, FunctionSpec]]] = {}
+    for position, (qualified_name, func_spec) in enumerate(all_functions.items()):
+        buckets.setdefault(func_spec.namespace, []).append(
+            (position, qualified_name, func_spec)
+        )
+    _namespace_buckets[id(all_functions)] = (all_functions, buckets)
+    return buckets
+
+
+def _include_all(func_spec) -> bool:
+    """Predicate used when no filters are configured."""
+    return True
+
+
+def _filter_fingerprint(config: ServerConfig) -> tuple[frozenset[str], ...]:
+    """Order-insensitive key describing a config's filter settings."""
+    return tuple(frozenset(getattr(config, field)) for field in _FILTER_FIELDS)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_predicate(
+    fingerprint: tuple[frozenset[str], ...],
+) -> Callable[[Any], bool]:
+    """Build the include test for a set of filter settings.
+
+    Compiled once per distinct fingerprint and shared by every filter, so
+    repeated _should_include_function() calls reuse the same closure.
+    """
+    if not any(fingerprint):
+        return _include_all
+
+    (
+        function_allowlist,
+        function_denylist,
+        domain_allowlist,
+        domain_denylist,
+        category_allowlist,
+        category_denylist,
+    ) = fingerprint
+
+    # Emptiness is checked once here rather than for every function
+    has_function_allowlist = bool(function_allowlist)
+    has_domain_allowlist = bool(domain_allowlist)
+    has_category_allowlist = bool(category_allowlist)
+
+    def include(func_spec) -> bool:
+        # Domain and category filters reject whole groups of functions,
+        # so they run before the per-function lists
+        namespace = func_spec.namespace
+        category = func_spec.category
+        if namespace in domain_denylist or category in category_denylist:
+            return False
+
+        # Allowlists only apply when specified
+        if has_domain_allowlist and namespace not in domain_allowlist:
+            return False
+        if has_category_allowlist and category not in category_allowlist:
+            return False
+
+        name = func_spec.function_name
+        if name in function_denylist:
+            return False
+        return not has_function_allowlist or name in function_allowlist
+
+    return include
+
+
 class FunctionFilter:
     """Filters mathematical functions based on configuration criteria."""
 
     def __init__(self, config: ServerConfig):
         self.config = config
         self._all_functions: Optional[dict[str, FunctionSpec]] = None
-        self._filtered_functions: Optional[dict[str, FunctionSpec]] = None
+        self._filtered_functions: Optional[Mapping[str, FunctionSpec]] = None
+        self._stats: Optional[tuple[Mapping[str, FunctionSpec], dict[str, Any]]] = None
+        self._predicate: Optional[Callable[[Any], bool]] = None
 
     def get_all_functions(self) -> dict[str, FunctionSpec]:
         """Get all available mathematical functions."""
         if self._all_functions is None:
-            self._all_functions = self._load_from_math_library()
+            self._all_functions = _load_from_math_library()
         return self._all_functions
 
-    def _load_from_math_library(self) -> dict[str, FunctionSpec]:
-        """Load functions using the standard chuk_mcp_math interface."""
-        # Import modules to register their functions
-        # This is required because chuk_mcp_math doesn't auto-import to avoid circular imports
-        from chuk_mcp_math import get_mcp_functions
-        from chuk_mcp_math import number_theory  # noqa: F401
-        from chuk_mcp_math.arithmetic import comparison, core  # noqa: F401
-
-        try:
-            # Import trigonometry functions if available
-            from chuk_mcp_math import trigonometry  # noqa: F401
-
-            logger.debug("Imported trigonometry module")
-        except ImportError:
-            logger.debug("Trigonometry module not available")
+    def get_filtered_functions(self) -> Mapping[str, FunctionSpec]:
+        """Get functions filtered according to configuration.
 
-        # Get the registered functions
-        functions = get_mcp_functions()
-        logger.info(f"Loaded {len(functions)} functions from chuk_mcp_math")
-        return functions  # type: ignore[no-any-return]
-
-    def get_filtered_functions(self) -> dict[str, FunctionSpec]:
-        """Get functions filtered according to configuration."""
+        The result is a read-only view shared with every filter that has the
+        same settings.
+        """
         if self._filtered_functions is None:
-            self._filtered_functions = self._apply_filters()
+            all_functions = self.get_all_functions()
+            key = _filter_fingerprint(self.config)
+            cached = _filtered_cache.get(key)
+            if cached is not None and cached[0] is all_functions:
+                _filtered_cache.move_to_end(key)
+                self._filtered_functions = cached[1]
+            else:
+                self._filtered_functions = MappingProxyType(self._apply_filters())
+                _filtered_cache[key] = (all_functions, self._filtered_functions)
+                if len(_filtered_cache) > _FILTERED_CACHE_SIZE:
+                    _filtered_cache.popitem(last=False)
         return self._filtered_functions
 
     def _apply_filters(self) -> dict[str, FunctionSpec]:
         """Apply all configured filters to the function list."""
         all_functions = self.get_all_functions()
-        filtered = {}
-
-        for qualified_name, func_spec in all_functions.items():
-            if self._should_include_function(func_spec):
-                filtered[qualified_name] = func_spec
+        include = self._build_predicate()
+        if include is _include_all:
+            filtered = dict(all_functions)
+            logger.info(f"No filters configured; using all {len(filtered)} functions")
+            return filtered
+
+        # When domain filters rule out whole namespaces, only visit the
+        # surviving namespace groups, merged back into registry order
+        buckets = _buckets_by_namespace(all_functions)
+        namespaces = set(self.config.domain_allowlist or buckets)
+        namespaces = namespaces.difference(self.config.domain_denylist)
+        if namespaces.issuperset(buckets):
+            candidates: Iterable[tuple[str, FunctionSpec]] = all_functions.items()
+        else:
+            groups = [buckets[ns] for ns in namespaces if ns in buckets]
+            candidates = ((name, spec) for _, name, spec in heapq.merge(*groups))
+
+        filtered = {
+            qualified_name: func_spec
+            for qualified_name, func_spec in candidates
+            if include(func_spec)
+        }
 
         logger.info(f"Filtered {len(all_functions)} functions down to {len(filtered)}")
         return filtered
 
+    def _build_predicate(self) -> Callable[[Any], bool]:
+        """Get the include test, built once per filter until reset_cache()."""
+        if self._predicate is None:
+            self._predicate = _compile_predicate(_filter_fingerprint(self.config))
+        return self._predicate
+
     def _should_include_function(self, func_spec) -> bool:
         """Determine if a function should be included based on filters."""
+        return self._build_predicate()(func_spec)
 
-        # Check function allowlist (if specified, only these are allowed)
-        if self.config.function_allowlist:
-            if func_spec.function_name not in self.config.function_allowlist:
-                return False
-
-        # Check function denylist
-        if func_spec.function_name in self.config.function_denylist:
-            return False
-
-        # Check domain allowlist (if specified, only these domains are allowed)
-        if self.config.domain_allowlist:
-            if func_spec.namespace not in self.config.domain_allowlist:
-                return False
-
-        # Check domain denylist
-        if func_spec.namespace in self.config.domain_denylist:
-            return False
-
-        # Check category allowlist (if specified, only these categories are allowed)
-        if self.config.category_allowlist:
-            if func_spec.category not in self.config.category_allowlist:
-                return False
-
-        # Check category denylist
-        if func_spec.category in self.config.category_denylist:
-            return False
+    def get_function_stats(self) -> dict[str, Any]:
+        """Get statistics about function filtering.
 
-        return True
+        The stats are cached until the filtered function set changes; each
+        call returns a copy, so callers can't alter the cached values.
+        """
+        filtered_functions = self.get_filtered_functions()
+        if self._stats is None or self._stats[0] is not filtered_functions:
+            self._stats = (filtered_functions, self._compute_stats())
+        stats = self._stats[1]
+        return {
+            **stats,
+            "domains_available": dict(stats["domains_available"]),
+            "domains_filtered": dict(stats["domains_filtered"]),
+        }
 
-    def get_function_stats(self) -> dict[str, Any]:
-        """Get statistics about function filtering."""
+    def _compute_stats(self) -> dict[str, Any]:
         all_functions = self.get_all_functions()
         filtered_functions = self.get_filtered_functions()
 
-        # Count by domain
-        all_domains: dict[str, int] = {}
-        filtered_domains: dict[str, int] = {}
-
-        for func_spec in all_functions.values():
-            domain = func_spec.namespace
-            all_domains[domain] = all_domains.get(domain, 0) + 1
-
-        for func_spec in filtered_functions.values():
-            domain = func_spec.namespace
-            filtered_domains[domain] = filtered_domains.get(domain, 0) + 1
+        # Count by domain; the namespace index already holds the registry
+        # grouped by domain, so only the filtered set needs a pass
+        all_domains = {
+            domain: len(bucket)
+            for domain, bucket in _buckets_by_namespace(all_functions).items()
+        }
+        filtered_domains = dict(
+            Counter(func_spec.namespace for func_spec in filtered_functions.values())
+        )
 
         # Avoid division by zero
         total_available = len(all_functions)
@@ -189,5 +327,10 @@ class FunctionFilter:
 
     def reset_cache(self):
         """Reset the function cache to force reloading."""
+        _load_from_math_library.cache_clear()
+        _filtered_cache.clear()
+        _namespace_buckets.clear()
         self._all_functions = None
         self._filtered_functions = None
+        self._stats = None
+        self._predicate = None
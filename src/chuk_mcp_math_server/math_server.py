@@ -4,12 +4,13 @@
 Mathematical MCP Server - using chuk-mcp-server framework.
 """
 
-import json
 import logging
-from typing import Dict, Any
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
 
 from chuk_mcp_server import ChukMCPServer
 
+from ._json import dumps_pretty
 from .config import ServerConfig
 from .function_filter import FunctionFilter
 
@@ -38,6 +39,7 @@ class ConfigurableMCPMathServer:
             logging.getLogger("chuk_mcp_math_server.cli").setLevel(logging.WARNING)
 
         self.function_filter = FunctionFilter(config)
+        self._available_functions_cache: Optional[tuple[Mapping[str, Any], str]] = None
 
         # Create the underlying chuk-mcp-server instance
         self.mcp_server = ChukMCPServer(
@@ -104,34 +106,7 @@ class ConfigurableMCPMathServer:
             mime_type="application/json",
         )
         async def available_functions() -> str:
-            filtered_functions = server.function_filter.get_filtered_functions()
-
-            functions_by_domain: dict[str, list[dict[str, Any]]] = {}
-            for func_spec in filtered_functions.values():
-                domain = func_spec.namespace
-                if domain not in functions_by_domain:
-                    functions_by_domain[domain] = []
-
-                functions_by_domain[domain].append(
-                    {
-                        "name": func_spec.function_name,
-                        "description": func_spec.description,
-                        "category": func_spec.category,
-                        "async_native": func_spec.is_async_native,
-                        "cached": func_spec.cache_strategy != "none",
-                    }
-                )
-
-            return json.dumps(
-                {
-                    "total_functions": len(filtered_functions),
-                    "functions_by_domain": functions_by_domain,
-                    "filtering_applied": server.function_filter.get_function_stats()[
-                        "filtering_active"
-                    ],
-                },
-                indent=2,
-            )
+            return server._available_functions_json()
 
         # Function statistics resource
         @self.mcp_server.resource(  # type: ignore[untyped-decorator]
@@ -142,7 +117,7 @@ class ConfigurableMCPMathServer:
         )
         async def function_stats() -> str:
             stats = server.function_filter.get_function_stats()
-            return json.dumps(stats, indent=2)
+            return dumps_pretty(stats)
 
         # Server configuration resource
         @self.mcp_server.resource(  # type: ignore[untyped-decorator]
@@ -152,10 +127,45 @@ class ConfigurableMCPMathServer:
             mime_type="application/json",
         )
         async def server_config() -> str:
-            return json.dumps(server.config.model_dump(), indent=2)
+            return dumps_pretty(server.config.model_dump())
 
         logger.info("Registered mathematical resources")
 
+    def _available_functions_json(self) -> str:
+        """Serialize the available-functions index.
+
+        The payload only depends on the filtered function set, so it is built
+        once and reused until that set changes.
+        """
+        filtered_functions = self.function_filter.get_filtered_functions()
+        cached = self._available_functions_cache
+        if cached is not None and cached[0] is filtered_functions:
+            return cached[1]
+
+        functions_by_domain: dict[str, list[dict[str, Any]]] = {}
+        for func_spec in filtered_functions.values():
+            functions_by_domain.setdefault(func_spec.namespace, []).append(
+                {
+                    "name": func_spec.function_name,
+                    "description": func_spec.description,
+                    "category": func_spec.category,
+                    "async_native": func_spec.is_async_native,
+                    "cached": func_spec.cache_strategy != "none",
+                }
+            )
+
+        payload = dumps_pretty(
+            {
+                "total_functions": len(filtered_functions),
+                "functions_by_domain": functions_by_domain,
+                "filtering_applied": self.function_filter.get_function_stats()[
+                    "filtering_active"
+                ],
+            }
+        )
+        self._available_functions_cache = (filtered_functions, payload)
+        return payload
+
     def get_function_stats(self) -> Dict[str, Any]:
         """Get function filtering statistics."""
         return self.function_filter.get_function_stats()
@@ -139,6 +139,42 @@ class TestCheckDependencies:
         result = check_dependencies()
         assert result is True
 
+    def test_check_dependencies_reports_missing(self, capsys):
+        """Test that check_dependencies reports missing packages."""
+        check_dependencies.cache_clear()
+        try:
+            with patch("importlib.util.find_spec", return_value=None):
+                result = check_dependencies()
+        finally:
+            check_dependencies.cache_clear()
+
+        assert result is False
+        assert "chuk-mcp-math" in capsys.readouterr().err
+
+    def test_check_dependencies_caches_result(self):
+        """Test that dependencies are only looked up once per process."""
+        check_dependencies.cache_clear()
+        try:
+            with patch("importlib.util.find_spec") as mock_find_spec:
+                assert check_dependencies() is True
+                assert check_dependencies() is True
+        finally:
+            check_dependencies.cache_clear()
+
+        assert mock_find_spec.call_count == 2  # one lookup per required module
+
+    def test_main_exits_on_missing_dependencies(self, monkeypatch):
+        """Test that main exits when dependencies are missing."""
+        monkeypatch.setattr(sys, "argv", ["chuk-mcp-math-server", "--show-config"])
+
+        with (
+            patch("chuk_mcp_math_server.cli.check_dependencies", return_value=False),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 1
+
 
 class TestMainFunction:
     """Test main CLI entry point."""
@@ -157,6 +193,113 @@ class TestMainFunction:
         # Should not have tried to run server
         mock_run_server.assert_not_called()
 
+    @patch("chuk_mcp_math_server.cli.run_server")
+    def test_main_with_config_stdin(self, mock_run_server, monkeypatch):
+        """Test main reading YAML configuration from stdin."""
+        import io
+
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["chuk-mcp-math-server", "--config-stdin", "--transport", "http"],
+        )
+        monkeypatch.setattr(
+            sys, "stdin", io.StringIO("function_allowlist:\n  - add\n  - subtract\n")
+        )
+
+        main()
+
+        mock_run_server.assert_called_once()
+        config = mock_run_server.call_args[0][0]
+        assert config.function_allowlist == ["add", "subtract"]
+
+    @patch("chuk_mcp_math_server.cli.run_server")
+    def test_main_config_stdin_rejects_stdio_server(self, mock_run_server, monkeypatch):
+        """Test that --config-stdin can't start the stdio transport."""
+        import io
+
+        monkeypatch.setattr(sys, "argv", ["chuk-mcp-math-server", "--config-stdin"])
+        monkeypatch.setattr(sys, "stdin", io.StringIO("function_allowlist:\n  - add\n"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        mock_run_server.assert_not_called()
+
+    @patch("chuk_mcp_math_server.cli.run_server")
+    def test_main_config_stdin_rejects_config_file(
+        self, mock_run_server, tmp_path, monkeypatch
+    ):
+        """Test that --config-stdin and --config can't be used together."""
+        import io
+
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text("function_allowlist:\n  - multiply\n")
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "chuk-mcp-math-server",
+                "--config-stdin",
+                "--config",
+                str(config_file),
+                "--transport",
+                "http",
+            ],
+        )
+        monkeypatch.setattr(sys, "stdin", io.StringIO("function_allowlist:\n  - add\n"))
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+        mock_run_server.assert_not_called()
+
+    @patch("chuk_mcp_math_server.cli.run_server")
+    def test_main_with_show_config_batch(self, mock_run_server, capsys, monkeypatch):
+        """Test main with --show-config-batch resolves every scenario."""
+        import io
+        import json
+
+        scenarios = [
+            {},
+            {"args": ["--domains", "arithmetic"]},
+            {"config": "function_allowlist:\n  - add\n"},
+            {"env": {"MCP_MATH_DOMAIN_ALLOWLIST": "number_theory"}},
+        ]
+        monkeypatch.setattr(
+            sys, "argv", ["chuk-mcp-math-server", "--show-config-batch"]
+        )
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(scenarios)))
+        monkeypatch.delenv("MCP_MATH_DOMAIN_ALLOWLIST", raising=False)
+
+        main()
+
+        configs = json.loads(capsys.readouterr().out)
+        assert len(configs) == 4
+        assert configs[0]["domain_allowlist"] == []
+        assert configs[1]["domain_allowlist"] == ["arithmetic"]
+        assert configs[2]["function_allowlist"] == ["add"]
+        assert configs[3]["domain_allowlist"] == ["number_theory"]
+
+        # Environment overrides should not leak out of their scenario
+        import os
+
+        assert "MCP_MATH_DOMAIN_ALLOWLIST" not in os.environ
+        mock_run_server.assert_not_called()
+
+    @patch("chuk_mcp_math_server.cli.run_server")
+    def test_main_cache_strategy_from_environment(self, mock_run_server, monkeypatch):
+        """Test that the cache strategy env var applies without the CLI flag."""
+        monkeypatch.setattr(sys, "argv", ["chuk-mcp-math-server"])
+        monkeypatch.setenv("MCP_MATH_CACHE_STRATEGY", "memory")
+
+        main()
+
+        config = mock_run_server.call_args[0][0]
+        assert config.cache_strategy == "memory"
+
     @patch("chuk_mcp_math_server.cli.run_server")
     @patch("chuk_mcp_math_server.math_config.MathServerConfig.save_to_file")
     def test_main_with_save_config(
@@ -256,7 +399,7 @@ class TestRunServer:
     def test_run_server_success(self, math_config):
         """Test successful server run."""
         with patch(
-            "chuk_mcp_math_server.cli.ConfigurableMCPMathServer"
+            "chuk_mcp_math_server.math_server.ConfigurableMCPMathServer"
         ) as mock_server_class:
             mock_server = mock_server_class.return_value
 
@@ -274,7 +417,7 @@ class TestRunServer:
     def test_run_server_exception(self, math_config):
         """Test server run with exception."""
         with patch(
-            "chuk_mcp_math_server.cli.ConfigurableMCPMathServer"
+            "chuk_mcp_math_server.math_server.ConfigurableMCPMathServer"
         ) as mock_server_class:
             mock_server = mock_server_class.return_value
             mock_server.run.side_effect = RuntimeError("Test error")
@@ -390,7 +533,7 @@ class TestRunServerLogging:
         config = MathServerConfig(transport="http", port=9000, host="127.0.0.1")
 
         with patch(
-            "chuk_mcp_math_server.cli.ConfigurableMCPMathServer"
+            "chuk_mcp_math_server.math_server.ConfigurableMCPMathServer"
         ) as mock_server_class:
             mock_server = mock_server_class.return_value
             mock_server.run.side_effect = KeyboardInterrupt
@@ -413,7 +556,7 @@ class TestRunServerLogging:
         config = MathServerConfig(transport="stdio")
 
         with patch(
-            "chuk_mcp_math_server.cli.ConfigurableMCPMathServer"
+            "chuk_mcp_math_server.math_server.ConfigurableMCPMathServer"
         ) as mock_server_class:
             mock_server = mock_server_class.return_value
             mock_server.run.side_effect = KeyboardInterrupt
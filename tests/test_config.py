@@ -1,6 +1,7 @@
 """Tests for configuration functionality."""
 
 import json
+import os
 import tempfile
 
 import yaml
@@ -241,6 +242,42 @@ class TestConfigEdgeCases:
             if Path(temp_path).exists():
                 Path(temp_path).unlink()
 
+    def test_yaml_imported_on_first_use(self):
+        """Test that loading the config module doesn't import PyYAML."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from chuk_mcp_math_server.config import ServerConfig; "
+            "ServerConfig(); print('yaml' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_legacy_filter_keys(self):
+        """Test that *_whitelist / *_blacklist keys map to the current names."""
+        config = ServerConfig(
+            domain_whitelist=["arithmetic"],
+            function_blacklist=["divide"],
+            category_whitelist=["core"],
+            category_allowlist=["comparison"],
+        )
+
+        assert config.domain_allowlist == ["arithmetic"]
+        assert config.function_denylist == ["divide"]
+        # The current key takes precedence over its legacy alias
+        assert config.category_allowlist == ["comparison"]
+
+    def test_bundled_config_uses_legacy_keys(self):
+        """Test that the bundled example configs still apply their filters."""
+        config_path = Path(__file__).parent.parent / "config" / "arithmetic_basic.yaml"
+        config = ServerConfig.from_file(config_path)
+
+        assert config.domain_allowlist == ["arithmetic"]
+        assert config.category_allowlist == ["core", "comparison"]
+
     def test_config_from_env(self, monkeypatch):
         """Test loading configuration from environment variables."""
         monkeypatch.setenv("MCP_SERVER_TRANSPORT", "http")
@@ -302,6 +339,20 @@ class TestConfigEdgeCases:
         # File value should be used for transport
         assert config.transport == "stdio"
 
+    def test_load_configuration_env_overrides_file(self, tmp_path, monkeypatch):
+        """Test that set env vars override the file and unset ones don't."""
+        from chuk_mcp_math_server.config import load_configuration_from_sources
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"port": 8000, "host": "127.0.0.1"}))
+        monkeypatch.setenv("MCP_SERVER_PORT", "9000")
+        monkeypatch.delenv("MCP_SERVER_HOST", raising=False)
+
+        config = load_configuration_from_sources(config_file=str(config_file))
+
+        assert config.port == 9000
+        assert config.host == "127.0.0.1"
+
 
 class TestMathConfigEnvironment:
     """Test math-specific environment variable handling."""
@@ -370,6 +421,8 @@ class TestMathConfigEnvironment:
         """Test that env loading errors are handled gracefully."""
         from unittest.mock import patch
 
+        monkeypatch.setenv("MCP_SERVER_CACHE_SIZE", "250")
+
         # Mock from_env to raise an exception
         with patch(
             "chuk_mcp_math_server.math_config.MathServerConfig.from_env",
@@ -379,3 +432,33 @@ class TestMathConfigEnvironment:
 
             # Should still work with defaults
             assert isinstance(config, MathServerConfig)
+
+    def test_load_math_configuration_ignores_empty_env(self, tmp_path, monkeypatch):
+        """Test that an empty math env var doesn't override the file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(yaml.dump({"port": 9001, "host": "127.0.0.1"}))
+        monkeypatch.setenv("MCP_MATH_PORT", "")
+        monkeypatch.setenv("MCP_MATH_HOST", "")
+        monkeypatch.delenv("MCP_SERVER_PORT", raising=False)
+        monkeypatch.delenv("MCP_SERVER_HOST", raising=False)
+
+        config = load_math_configuration_from_sources(config_file=str(config_file))
+
+        assert config.port == 9001
+        assert config.host == "127.0.0.1"
+
+    def test_load_math_configuration_skips_env_without_overrides(self, monkeypatch):
+        """Test that the env config is only built when an env var is set."""
+        from unittest.mock import patch
+
+        for key in list(os.environ):
+            if key.startswith(("MCP_MATH_", "MCP_SERVER_")):
+                monkeypatch.delenv(key)
+
+        with patch(
+            "chuk_mcp_math_server.math_config.MathServerConfig.from_env"
+        ) as mock_from_env:
+            config = load_math_configuration_from_sources()
+
+        mock_from_env.assert_not_called()
+        assert config == MathServerConfig()
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from chuk_mcp_math_server.function_filter import FunctionFilter, MockFunctionSpec
 from chuk_mcp_math_server import MathServerConfig
 
@@ -93,6 +95,8 @@ class TestFunctionFilter:
         assert stats["total_available"] == 642
         assert stats["total_filtered"] == 642
         assert not stats["filtering_active"]
+        assert sum(stats["domains_available"].values()) == 642
+        assert stats["domains_filtered"] == stats["domains_available"]
 
     def test_function_stats_with_filtering(self, filtered_config):
         """Test function statistics with filtering active."""
@@ -149,6 +153,7 @@ class TestMockFunctionSpec:
         assert spec.function_ref == sample_func
         assert spec.is_async_native is True
         assert spec.cache_strategy == "none"
+        assert spec.description == "add function from arithmetic"
 
     def test_mock_function_spec_parameters(self):
         """Test parameter extraction from function signature."""
@@ -225,6 +230,126 @@ class TestFunctionFilterEdgeCases:
 
         assert all1 is all2  # Same object reference
 
+    def test_function_stats_cached(self):
+        """Test that stats are reused until the cache is reset."""
+        filter = FunctionFilter(MathServerConfig(domain_allowlist=["arithmetic"]))
+
+        stats1 = filter.get_function_stats()
+        with patch.object(filter, "_compute_stats") as mock_compute:
+            assert filter.get_function_stats() == stats1
+        mock_compute.assert_not_called()
+
+        filter.reset_cache()
+        assert filter.get_function_stats() == stats1
+
+    def test_function_stats_copies_are_independent(self):
+        """Test that mutating returned stats doesn't affect later calls."""
+        filter = FunctionFilter(MathServerConfig(domain_allowlist=["arithmetic"]))
+
+        stats = filter.get_function_stats()
+        expected = {**stats, "domains_filtered": dict(stats["domains_filtered"])}
+        stats["total_filtered"] = -1
+        stats["domains_filtered"]["arithmetic"] = -1
+
+        assert filter.get_function_stats() == expected
+
+    def test_filtered_functions_shared_between_filters(self):
+        """Test that filters with the same settings share one filtered view."""
+        config1 = MathServerConfig(domain_allowlist=["arithmetic", "number_theory"])
+        config2 = MathServerConfig(domain_allowlist=["number_theory", "arithmetic"])
+        other = MathServerConfig(domain_allowlist=["arithmetic"])
+
+        functions1 = FunctionFilter(config1).get_filtered_functions()
+
+        assert FunctionFilter(config2).get_filtered_functions() is functions1
+        assert FunctionFilter(other).get_filtered_functions() is not functions1
+
+    def test_shared_filtered_functions_are_read_only(self, math_config):
+        """Test that a shared filtered view can't be changed through one filter."""
+        functions = FunctionFilter(math_config).get_filtered_functions()
+
+        with pytest.raises(TypeError):
+            functions["arithmetic.add"] = None
+
+    def test_filtered_cache_is_bounded(self):
+        """Test that the shared filtered views are evicted least recently used."""
+        from chuk_mcp_math_server import function_filter
+
+        with patch.object(function_filter, "_FILTERED_CACHE_SIZE", 2):
+            function_filter._filtered_cache.clear()
+            first = MathServerConfig(function_allowlist=["add"])
+            FunctionFilter(first).get_filtered_functions()
+            for name in ["subtract", "multiply"]:
+                config = MathServerConfig(function_allowlist=[name])
+                FunctionFilter(config).get_filtered_functions()
+
+            assert len(function_filter._filtered_cache) == 2
+            assert (
+                function_filter._filter_fingerprint(first)
+                not in function_filter._filtered_cache
+            )
+
+    def test_domain_filtering_preserves_registry_order(self):
+        """Test that namespace-bucketed filtering keeps registry order."""
+        config = MathServerConfig(
+            domain_allowlist=["arithmetic", "trigonometry"],
+            category_denylist=["comparison"],
+        )
+        filter = FunctionFilter(config)
+        include = filter._build_predicate()
+
+        expected = [
+            name for name, spec in filter.get_all_functions().items() if include(spec)
+        ]
+
+        assert expected
+        assert list(filter._apply_filters()) == expected
+
+    def test_predicate_compiled_once_per_settings(self):
+        """Test that the include test is reused until the cache is reset."""
+        from chuk_mcp_math_server import function_filter
+
+        config = MathServerConfig(function_denylist=["add"])
+        filter = FunctionFilter(config)
+        predicate = filter._build_predicate()
+
+        with patch.object(
+            function_filter,
+            "_filter_fingerprint",
+            wraps=function_filter._filter_fingerprint,
+        ) as mock_fingerprint:
+            spec = MockFunctionSpec("add", "arithmetic", "core", lambda x: x)
+            assert not filter._should_include_function(spec)
+            assert filter._build_predicate() is predicate
+        mock_fingerprint.assert_not_called()
+
+        assert FunctionFilter(config.model_copy())._build_predicate() is predicate
+
+        config.function_denylist = ["subtract"]
+        filter.reset_cache()
+        assert filter._build_predicate() is not predicate
+
+    def test_no_filters_skips_predicate(self):
+        """Test that an unfiltered config copies the registry without filtering."""
+        filter = FunctionFilter(MathServerConfig(transport="stdio"))
+        all_functions = filter.get_all_functions()
+
+        with patch(
+            "chuk_mcp_math_server.function_filter._buckets_by_namespace"
+        ) as mock_buckets:
+            filtered = filter._apply_filters()
+
+        mock_buckets.assert_not_called()
+        assert filtered == all_functions
+        assert filtered is not all_functions
+
+    def test_all_functions_shared_between_filters(self, math_config, filtered_config):
+        """Test that the function registry is loaded once per process."""
+        all1 = FunctionFilter(math_config).get_all_functions()
+        all2 = FunctionFilter(filtered_config).get_all_functions()
+
+        assert all1 is all2
+
     @patch("chuk_mcp_math_server.function_filter.logger")
     def test_function_loading_handles_errors(self, mock_logger):
         """Test that function loading handles errors gracefully."""
@@ -364,6 +489,7 @@ class TestFunctionFilterEdgeCases:
         # Content should be the same but not the same object
         assert len(functions1) == len(functions2)
         assert len(all1) == len(all2)
+        assert functions2 is not functions1
 
 
 class TestMockFunctionSpecEdgeCases:
@@ -426,3 +552,23 @@ class TestMockFunctionSpecEdgeCases:
 
         # Should have loaded functions successfully even if trig is unavailable
         assert len(all_functions) > 0
+
+    @patch("chuk_mcp_math_server.function_filter.logger")
+    def test_trigonometry_unavailable(self, mock_logger, monkeypatch):
+        """Test that a trigonometry module that fails to import is skipped."""
+        import sys
+
+        import chuk_mcp_math
+
+        monkeypatch.delattr(chuk_mcp_math, "trigonometry")
+        monkeypatch.setitem(sys.modules, "chuk_mcp_math.trigonometry", None)
+
+        filter = FunctionFilter(MathServerConfig(transport="stdio"))
+        filter.reset_cache()
+        try:
+            all_functions = filter.get_all_functions()
+        finally:
+            filter.reset_cache()
+
+        assert len(all_functions) > 0
+        mock_logger.debug.assert_any_call("Trigonometry module not available")
@@ -12,6 +12,37 @@ class TestPackageInfo:
         assert isinstance(__version__, str)
         assert len(__version__) > 0
 
+    def test_import_is_lazy(self):
+        """Test that importing the package doesn't load the server modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, chuk_mcp_math_server; "
+            "print('chuk_mcp_math_server.math_server' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_exports(self):
+        """Test that lazily exported names resolve and are listed."""
+        import chuk_mcp_math_server
+        from chuk_mcp_math_server.function_filter import FunctionFilter
+
+        assert chuk_mcp_math_server.FunctionFilter is FunctionFilter
+        assert set(chuk_mcp_math_server.__all__) <= set(dir(chuk_mcp_math_server))
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes still raise AttributeError."""
+        import pytest
+
+        import chuk_mcp_math_server
+
+        with pytest.raises(AttributeError):
+            chuk_mcp_math_server.does_not_exist  # noqa: B018
+
 
 class TestConvenienceFunctions:
     """Test convenience server startup functions."""
@@ -0,0 +1,22 @@
+"""Tests for the JSON serialization helpers."""
+
+import json
+
+from chuk_mcp_math_server import _json
+
+
+class TestDumpsPretty:
+    """Test indented JSON serialization."""
+
+    def test_matches_stdlib_output(self):
+        """Test that output matches json.dumps(indent=2)."""
+        data = {"transport": "stdio", "port": 8000, "ratio": 0.5, "items": ["a"]}
+
+        assert _json.dumps_pretty(data) == json.dumps(data, indent=2)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test serialization when orjson is not installed."""
+        monkeypatch.setattr(_json, "HAS_ORJSON", False)
+        data = {"enable_tools": True, "function_allowlist": []}
+
+        assert _json.dumps_pretty(data) == json.dumps(data, indent=2)
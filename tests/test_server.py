@@ -198,6 +198,9 @@ class TestServerResources:
         assert "filtering_applied" in result_data
         assert result_data["total_functions"] == 2
 
+        # Repeated reads reuse the serialized payload
+        assert await available_funcs_resource.handler() is result
+
     async def test_function_stats_resource(self):
         """Test the function_stats resource."""
         import json